@@ -45,11 +45,13 @@ class GitCommit(models.Model):
     author_name = fields.Char(
         string='Author Name',
         required=True,
+        index='trigram',
         help='Name of the commit author'
     )
     
     author_email = fields.Char(
         string='Author Email',
+        index='trigram',
         help='Email of the commit author'
     )
     
@@ -2,6 +2,7 @@
 
 import logging
 from datetime import datetime, timedelta
+from psycopg2 import IntegrityError
 from odoo import models, api, fields, _
 from odoo.exceptions import UserError, ValidationError
 
@@ -178,6 +179,117 @@ class MappingService(models.TransientModel):
                 'skipped_count': 0
             }
     
+    @api.model
+    def create_mappings(self, vals_list):
+        """Create several commit to timesheet mappings in one batch.
+
+        Every row is validated first, so the common failures (duplicates,
+        missing records, business rules) never reach the database; the valid
+        ones are then inserted with a single create() call instead of one
+        per commit.
+
+        Args:
+            vals_list: List of timesheet.commit.mapping value dicts, each with
+                at least commit_id and timesheet_line_id
+
+        Returns:
+            tuple: (list of created mapping IDs, list of error dicts with
+            commit_id, timesheet_line_id and error)
+        """
+        errors = []
+        if not vals_list:
+            return [], errors
+
+        # Load every commit, timesheet and existing mapping once for the batch,
+        # limited to the columns the validation below and the callers' error
+        # messages read, rather than every prefetchable column
+        commit_records = self.env['git.commit'].browse(
+            {vals['commit_id'] for vals in vals_list}
+        ).exists()
+        commit_records.fetch(['short_hash', 'commit_date', 'company_id'])
+        timesheet_records = self.env['account.analytic.line'].browse(
+            {vals['timesheet_line_id'] for vals in vals_list}
+        ).exists()
+        timesheet_records.fetch(['name', 'date', 'project_id', 'company_id'])
+        commits = {commit.id: commit for commit in commit_records}
+        timesheets = {timesheet.id: timesheet for timesheet in timesheet_records}
+        mapped_commit_ids = {
+            row['commit_id'] for row in self.env['timesheet.commit.mapping'].search_read(
+                [('commit_id', 'in', list(commits))], ['commit_id'], load=None
+            )
+        }
+
+        valid_vals = []
+        for vals in vals_list:
+            commit = commits.get(vals['commit_id'])
+            timesheet = timesheets.get(vals['timesheet_line_id'])
+
+            if not commit:
+                error = _('Commit not found')
+            elif not timesheet:
+                error = _('Timesheet entry not found')
+            elif commit.id in mapped_commit_ids:
+                error = _('Commit %s is already mapped') % commit.short_hash
+            else:
+                error = self._validate_mapping_rules(commit, timesheet, raise_error=False)['error']
+
+            if error:
+                errors.append({
+                    'commit_id': vals['commit_id'],
+                    'timesheet_line_id': vals['timesheet_line_id'],
+                    'error': error
+                })
+                continue
+
+            # A commit listed twice in the batch may only be mapped once
+            mapped_commit_ids.add(commit.id)
+            # Same default description as create_mapping
+            valid_vals.append(dict(
+                vals,
+                description=vals.get('description') or f'Manual mapping: {commit.short_hash}',
+                mapped_by=self.env.user.id
+            ))
+
+        if not valid_vals:
+            return [], errors
+
+        mappings = self._create_in_savepoint(valid_vals, errors)
+        return mappings.ids, errors
+
+    def _create_in_savepoint(self, vals_list, errors):
+        """Create mappings in one savepoint, bisecting the batch on failure.
+
+        When the batch is rejected by a row-level error (a constraint or
+        integrity error the pre-validation could not foresee) it is split in
+        halves and retried, so only the failing rows are dropped, in
+        O(log N) extra attempts per bad row rather than one savepoint per
+        row. Any other error (serialization failures, lost connections)
+        is not caused by a row and is re-raised untouched.
+
+        Args:
+            vals_list: List of timesheet.commit.mapping value dicts
+            errors: List the failed rows are appended to, as error dicts
+
+        Returns:
+            timesheet.commit.mapping recordset of the created mappings
+        """
+        try:
+            with self.env.cr.savepoint():
+                return self.env['timesheet.commit.mapping'].create(vals_list)
+        except (ValidationError, UserError, IntegrityError) as e:
+            if len(vals_list) == 1:
+                _logger.error(f"Failed to create mapping: {str(e)}")
+                errors.append({
+                    'commit_id': vals_list[0]['commit_id'],
+                    'timesheet_line_id': vals_list[0]['timesheet_line_id'],
+                    'error': str(e)
+                })
+                return self.env['timesheet.commit.mapping']
+
+        middle = len(vals_list) // 2
+        return (self._create_in_savepoint(vals_list[:middle], errors)
+                | self._create_in_savepoint(vals_list[middle:], errors))
+
     @api.model
     def suggest_mappings(self, commit_ids=None, timesheet_line_ids=None, limit=10):
         """Generate intelligent mapping suggestions.
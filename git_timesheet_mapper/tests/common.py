@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+
+import json
+
+import requests
+
+from odoo.tests import HttpCase
+from odoo.tools import mute_logger
+
+# Servers usually append a charset, so compare on the media type prefix only
+JSON_CT = 'application/json'
+JSON_HEADERS = {'Content-Type': JSON_CT}
+
+
+class JsonApiCaseMixin:
+    """Helpers for posting JSON to the addon controllers and checking the
+    ``{'success': ..., 'data'/'error': ...}`` response envelope."""
+
+    def _post_json(self, url, data=None, session=None):
+        """Post ``data`` as JSON to ``url`` and return ``(response, body)``.
+
+        ``body`` is the decoded JSON payload, or None when the response is not
+        JSON (e.g. the HTML 404 page served while no controller exists).
+        """
+        payload = json.dumps(data) if data is not None else ''
+        if session is None:
+            response = self.url_open(url, data=payload, headers=JSON_HEADERS)
+        else:
+            response = session.post(self.base_url() + url, data=payload, headers=JSON_HEADERS)
+        try:
+            body = json.loads(response.content.decode())
+        except ValueError:
+            body = None
+        return response, body
+
+    def _assert_success(self, response, body, required_fields=()):
+        """Assert a 200 JSON success envelope whose data holds ``required_fields``."""
+        self.assertEqual(response.status_code, 200, "Request should return 200")
+        self.assertTrue(response.headers.get('Content-Type', '').startswith(JSON_CT),
+                        "Response should be JSON format")
+        self.assertIsNotNone(body, "Response body should be JSON")
+        self.assertIn('success', body, "Response should contain 'success' field")
+        self.assertTrue(body['success'], "Success should be True")
+        self.assertIn('data', body, "Response should contain 'data' field")
+        for field in required_fields:
+            self.assertIn(field, body['data'], f"Response data should contain '{field}' field")
+        return body['data']
+
+    def _assert_validation_error(self, response, body, expected_code, status=400):
+        """Assert an error envelope carrying ``expected_code``."""
+        self.assertEqual(response.status_code, status, f"Request should return {status}")
+        self.assertIsNotNone(body, "Response body should be JSON")
+        self.assertFalse(body['success'], "Success should be False")
+        self.assertEqual(body['error']['code'], expected_code,
+                         f"Error code should be {expected_code}")
+        return body['error']
+
+
+class GitTimesheetHttpCase(JsonApiCaseMixin, HttpCase):
+    """Shared base class for the mapping and repository API contract tests.
+
+    Both test users are created once per class in a single batched create;
+    subclasses pick the one to authenticate as through ``api_login``.
+    """
+
+    api_login = None
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.env = cls.env(context=dict(cls.env.context, tracking_disable=True))
+
+        # Mute the expected request errors once for the whole class
+        muted = mute_logger('odoo.addons.base.models.ir_http', 'odoo.http')
+        muted.__enter__()
+        cls.addClassCleanup(muted.__exit__, None, None, None)
+
+        # Resolve the group xmlids once for the whole class
+        cls.user_group_id = cls.env.ref('git_timesheet_mapper.group_git_timesheet_user').id
+        cls.admin_group_id = cls.env.ref('git_timesheet_mapper.group_git_repository_admin').id
+
+        # Create the timesheet mapping user and the repository admin together
+        cls.mapping_user, cls.repo_user = cls.env['res.users'].create([{
+            'name': 'Test Mapping User',
+            'login': 'test_mapping_user',
+            'email': 'mapping@example.com',
+            'groups_id': [(4, cls.user_group_id)]
+        }, {
+            'name': 'Test Repository Admin',
+            'login': 'test_repo_admin',
+            'email': 'test@example.com',
+            'groups_id': [(4, cls.admin_group_id)]
+        }])
+
+        # Cookieless session for authentication-required checks, so those tests
+        # never have to drop the authenticated session of the test case
+        cls.anon_session = requests.Session()
+        cls.addClassCleanup(cls.anon_session.close)
+
+    def setUp(self):
+        super().setUp()
+
+        # Authentication setup for API calls
+        if self.api_login:
+            self.authenticate(self.api_login, self.api_login)
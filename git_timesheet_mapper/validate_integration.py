@@ -14,17 +14,105 @@ Options:
 """
 
 import argparse
+import concurrent.futures
 import json
 import logging
 import os
+import re
 import sys
 import time
+from collections import Counter
 from pathlib import Path
 
 # Add the project root to the Python path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
+
+class _NeedleSet:
+    """A fixed set of byte needles matched against file content in one pass."""
+
+    def __init__(self, *needles):
+        self.ordered = needles
+        self.needles = frozenset(needles)
+        # Longest first, inside a lookahead so matches may overlap and every
+        # needle is reported from a single scan of the content
+        alternation = b'|'.join(re.escape(n) for n in sorted(needles, key=len, reverse=True))
+        self._pattern = re.compile(b'(?=(' + alternation + b'))')
+
+    def found(self, content):
+        """Return the needles occurring anywhere in ``content``."""
+        found = set(self._pattern.findall(content))
+        # A needle that is a prefix of a longer match is hidden at that position
+        found.update(n for n in self.needles if any(f.startswith(n) for f in found))
+        return found
+
+    def any_in(self, content):
+        """Return True if at least one needle occurs in ``content``."""
+        return self._pattern.search(content) is not None
+
+    def all_in(self, content):
+        """Return True if every needle occurs in ``content``."""
+        return self.needles <= self.found(content)
+
+    def missing(self, content):
+        """Return the needles absent from ``content``, in declaration order."""
+        found = self.found(content)
+        return [n for n in self.ordered if n not in found]
+
+
+# Patterns every frontend asset must contain, keyed by file name where it varies
+_JS_REQUIRED = {
+    'commit_browser.js': _NeedleSet(
+        b'/** @odoo-module **/',
+        b'import { Component',
+        b'export class GitCommitBrowser',
+        b'static template',
+        b'setup()',
+    ),
+    'bulk_mapper.js': _NeedleSet(
+        b'/** @odoo-module **/',
+        b'import { Component',
+        b'export class BulkMappingComponent',
+        b'static template',
+        b'setup()',
+    ),
+}
+# Each component source with the template marker it must declare and the
+# template name templates.xml must define, encoded once
+_TEMPLATE_BINDINGS = tuple(
+    (js_file, f'static template = "{name}"'.encode(), name.encode())
+    for js_file, name in (
+        ('static/src/js/commit_browser.js', 'git_timesheet_mapper.CommitBrowser'),
+        ('static/src/js/bulk_mapper.js', 'git_timesheet_mapper.BulkMapper'),
+    )
+)
+_CSS_REQUIRED = _NeedleSet(b':root', b'.git-timesheet-mapper', b'@media')
+_TEMPLATES_REQUIRED = _NeedleSet(b'git_timesheet_mapper.CommitBrowser', b'git_timesheet_mapper.BulkMapper')
+
+# OWL components whose imports, registration and services are checked together
+_JS_COMPONENTS = ('commit_browser.js', 'bulk_mapper.js')
+_ODOO_IMPORT_NEEDLES = frozenset((b'/** @odoo-module **/', b'import {', b'@odoo/owl'))
+_LAZY_NEEDLES = frozenset((b'loading', b'async'))
+_JS_NEEDLES = _NeedleSet(
+    *_ODOO_IMPORT_NEEDLES, *_LAZY_NEEDLES,
+    b'registry.category(', b'useService(', b'this.rpc', b'this.orm',
+)
+_RESPONSIVE_NEEDLES = _NeedleSet(b'@media', b'768px', b'flex', b'grid', b'vw', b'vh', b'%')
+_SEMANTIC_NEEDLES = _NeedleSet(b'<button', b'<label', b'<input', b'<select', b'<table', b'<th', b'<td')
+_ARIA_NEEDLES = _NeedleSet(b'aria-', b'role=', b't-att-aria', b'aria-label', b'aria-describedby')
+_KEYBOARD_NEEDLES = _NeedleSet(b'tabindex', b't-on-keydown', b't-on-keyup', b't-on-keypress', b'focus')
+_CONTRAST_NEEDLES = _NeedleSet(b'color:', b'background')
+_CONDITIONAL_NEEDLES = _NeedleSet(b't-if=', b't-foreach=', b't-else=')
+_ASSET_NEEDLES = _NeedleSet(b'bundle=', b'sequence=')
+
+# Class/id selector characters, with space-delimited combinators captured
+_SELECTOR_RE = re.compile(rb'( [>+~] )|[.#]')
+
+# Rest of the decorator line; route arguments may themselves contain parentheses
+_ROUTE_RE = re.compile(rb'@http\.route\(.*')
+
+
 class IntegrationValidator:
     """Validates the integration of the Git Timesheet Mapper addon."""
     
@@ -39,6 +127,16 @@ class IntegrationValidator:
             'accessibility': {'status': 'pending', 'details': []},
             'performance': {'status': 'pending', 'details': []},
         }
+        # Addon root and the absolute path of every addon file looked up so far,
+        # kept as plain strings so hot checks skip pathlib joins
+        self._addon_root = os.path.join(str(project_root), 'git_timesheet_mapper')
+        self._paths = {}
+        # Contents of every file read so far, so each one is read at most once
+        self._file_cache = {}
+        # Relative paths of every file in the addon, filled by one directory walk
+        self._present_files = None
+        # Flags computed from the OWL component sources, filled in one pass
+        self._js_flags = None
         
     def setup_logging(self):
         """Setup logging configuration."""
@@ -50,6 +148,41 @@ class IntegrationValidator:
         )
         self.logger = logging.getLogger(__name__)
         
+    def _path(self, rel_path):
+        """Return the absolute path string of the addon file ``rel_path``."""
+        path = self._paths.get(rel_path)
+        if path is None:
+            path = self._paths[rel_path] = os.path.join(self._addon_root, rel_path)
+        return path
+
+    def _read(self, rel_path):
+        """Return the raw bytes of the addon file ``rel_path``, or None if it
+        does not exist.
+
+        Every check is a plain substring test, so contents are kept as bytes
+        and never decoded.
+        """
+        if rel_path not in self._file_cache:
+            try:
+                with open(self._path(rel_path), 'rb') as f:
+                    content = f.read()
+            except FileNotFoundError:
+                content = None
+            self._file_cache[rel_path] = content
+        return self._file_cache[rel_path]
+
+    def _present(self):
+        """Return the set of addon-relative file paths, walking the tree once."""
+        if self._present_files is None:
+            present = set()
+            for root, dirs, files in os.walk(self._addon_root):
+                dirs[:] = [d for d in dirs if d != '__pycache__']
+                rel_root = os.path.relpath(root, self._addon_root).replace(os.sep, '/')
+                prefix = '' if rel_root == '.' else rel_root + '/'
+                present.update(prefix + f for f in files)
+            self._present_files = present
+        return self._present_files
+
     def validate_frontend_assets(self):
         """Validate that all frontend assets exist and are properly structured."""
         self.logger.info("Validating frontend assets...")
@@ -63,21 +196,17 @@ class IntegrationValidator:
             'data/assets.xml',
         ]
         
-        missing_files = []
+        present = self._present()
+        missing_files = [f for f in required_files if f not in present]
         invalid_files = []
         
         for file_path in required_files:
-            full_path = project_root / 'git_timesheet_mapper' / file_path
-            
-            if not full_path.exists():
-                missing_files.append(file_path)
+            if file_path not in present:
                 continue
+            content = self._read(file_path)
                 
             # Validate file content
             try:
-                with open(full_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                    
                 if file_path.endswith('.js'):
                     self._validate_javascript_file(content, file_path)
                 elif file_path.endswith('.css'):
@@ -102,55 +231,28 @@ class IntegrationValidator:
                 'message': 'All frontend assets are present and valid'
             }
             
-        self.logger.info(f"Frontend assets validation: {self.validation_results['frontend_assets']['status']}")
+        self.logger.info("Frontend assets validation: %s", self.validation_results['frontend_assets']['status'])
         
     def _validate_javascript_file(self, content, file_path):
         """Validate JavaScript file structure and syntax."""
-        required_patterns = {
-            'commit_browser.js': [
-                '/** @odoo-module **/',
-                'import { Component',
-                'export class GitCommitBrowser',
-                'static template',
-                'setup()',
-            ],
-            'bulk_mapper.js': [
-                '/** @odoo-module **/',
-                'import { Component',
-                'export class BulkMappingComponent',
-                'static template',
-                'setup()',
-            ]
-        }
-        
         filename = file_path.split('/')[-1]
-        if filename in required_patterns:
-            for pattern in required_patterns[filename]:
-                if pattern not in content:
-                    raise ValueError(f"Missing required pattern: {pattern}")
+        if filename in _JS_REQUIRED:
+            missing = _JS_REQUIRED[filename].missing(content)
+            if missing:
+                raise ValueError(f"Missing required pattern: {missing[0].decode()}")
                     
     def _validate_css_file(self, content, file_path):
         """Validate CSS file structure and syntax."""
-        required_patterns = [
-            ':root',
-            '.git-timesheet-mapper',
-            '@media',
-        ]
-        
-        for pattern in required_patterns:
-            if pattern not in content:
-                raise ValueError(f"Missing required CSS pattern: {pattern}")
+        missing = _CSS_REQUIRED.missing(content)
+        if missing:
+            raise ValueError(f"Missing required CSS pattern: {missing[0].decode()}")
                 
     def _validate_xml_file(self, content, file_path):
         """Validate XML file structure and syntax."""
         if 'templates.xml' in file_path:
-            required_templates = [
-                'git_timesheet_mapper.CommitBrowser',
-                'git_timesheet_mapper.BulkMapper',
-            ]
-            for template in required_templates:
-                if template not in content:
-                    raise ValueError(f"Missing required template: {template}")
+            missing = _TEMPLATES_REQUIRED.missing(content)
+            if missing:
+                raise ValueError(f"Missing required template: {missing[0].decode()}")
                     
     def validate_backend_apis(self):
         """Validate backend API endpoints and functionality."""
@@ -165,31 +267,23 @@ class IntegrationValidator:
             'services/mapping_service.py',
         ]
         
-        missing_files = []
+        present = self._present()
+        missing_files = [f for f in required_api_files if f not in present]
         api_endpoints = []
         
         for file_path in required_api_files:
-            full_path = project_root / 'git_timesheet_mapper' / file_path
-            
-            if not full_path.exists():
-                missing_files.append(file_path)
+            if file_path not in present:
                 continue
+            content = self._read(file_path)
                 
             # Extract API endpoints
             try:
-                with open(full_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                    
-                if '@http.route' in content:
-                    # Extract route definitions
-                    lines = content.split('\n')
-                    for i, line in enumerate(lines):
-                        if '@http.route' in line:
-                            route_line = line.strip()
-                            api_endpoints.append(route_line)
-                            
+                api_endpoints.extend(
+                    m.group(0).rstrip().decode('utf-8', 'replace')
+                    for m in _ROUTE_RE.finditer(content)
+                )
             except Exception as e:
-                self.logger.warning(f"Could not parse {file_path}: {str(e)}")
+                self.logger.warning("Could not parse %s: %s", file_path, e)
                 
         # Validate expected endpoints
         expected_endpoints = [
@@ -221,7 +315,7 @@ class IntegrationValidator:
                 'total_endpoints': len(api_endpoints)
             }
             
-        self.logger.info(f"Backend APIs validation: {self.validation_results['backend_apis']['status']}")
+        self.logger.info("Backend APIs validation: %s", self.validation_results['backend_apis']['status'])
         
     def validate_component_integration(self):
         """Validate integration between frontend components and backend."""
@@ -249,109 +343,100 @@ class IntegrationValidator:
                 'message': 'All integration checks passed'
             }
             
-        self.logger.info(f"Component integration validation: {self.validation_results['component_integration']['status']}")
+        self.logger.info("Component integration validation: %s", self.validation_results['component_integration']['status'])
         
+    def _assets_ok(self):
+        """Return True if the frontend asset stage passed.
+
+        The component checks read the same JS and template files, so there is
+        no point scanning them once that stage has failed.
+        """
+        return self.validation_results['frontend_assets']['status'] == 'passed'
+
+    def _analyze_js_files(self):
+        """Scan each OWL component source once and derive every JS flag from it.
+
+        Missing files are skipped; the import, registry and service flags
+        require every present file to pass, lazy loading needs any one.
+        """
+        if self._js_flags is None:
+            flags = {
+                'has_odoo_module': True,
+                'has_registry': True,
+                'has_service': True,
+                'has_async': False,
+            }
+            for name in _JS_COMPONENTS:
+                content = self._read('static/src/js/' + name)
+                if content is None:
+                    continue
+                found = _JS_NEEDLES.found(content)
+                flags['has_odoo_module'] &= _ODOO_IMPORT_NEEDLES <= found
+                flags['has_registry'] &= b'registry.category(' in found
+                flags['has_service'] &= (
+                    b'useService(' in found
+                    and (b'this.rpc' in found or b'this.orm' in found)
+                )
+                flags['has_async'] |= not _LAZY_NEEDLES.isdisjoint(found)
+            self._js_flags = flags
+        return self._js_flags
+
     def _check_odoo_imports(self):
         """Check if Odoo module imports are correct."""
-        js_files = [
-            'static/src/js/commit_browser.js',
-            'static/src/js/bulk_mapper.js',
-        ]
-        
-        for file_path in js_files:
-            full_path = project_root / 'git_timesheet_mapper' / file_path
-            if full_path.exists():
-                with open(full_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                    if '/** @odoo-module **/' not in content:
-                        return False
-                    if 'import {' not in content:
-                        return False
-                    if '@odoo/owl' not in content:
-                        return False
-        return True
+        if not self._assets_ok():
+            return False
+        return self._analyze_js_files()['has_odoo_module']
         
     def _check_component_registration(self):
         """Check if components are properly registered."""
-        js_files = [
-            'static/src/js/commit_browser.js',
-            'static/src/js/bulk_mapper.js',
-        ]
-        
-        for file_path in js_files:
-            full_path = project_root / 'git_timesheet_mapper' / file_path
-            if full_path.exists():
-                with open(full_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                    if 'registry.category(' not in content:
-                        return False
-        return True
+        if not self._assets_ok():
+            return False
+        return self._analyze_js_files()['has_registry']
         
     def _check_service_integration(self):
         """Check if services are properly integrated."""
-        js_files = [
-            'static/src/js/commit_browser.js',
-            'static/src/js/bulk_mapper.js',
-        ]
-        
-        for file_path in js_files:
-            full_path = project_root / 'git_timesheet_mapper' / file_path
-            if full_path.exists():
-                with open(full_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                    if 'useService(' not in content:
-                        return False
-                    if 'this.rpc' not in content and 'this.orm' not in content:
-                        return False
-        return True
+        if not self._assets_ok():
+            return False
+        return self._analyze_js_files()['has_service']
         
     def _check_template_references(self):
         """Check if template references are correct."""
-        template_file = project_root / 'git_timesheet_mapper' / 'static/src/xml/templates.xml'
-        if not template_file.exists():
+        if not self._assets_ok():
+            return False
+        content = self._read('static/src/xml/templates.xml')
+        if content is None:
             return False
             
-        with open(template_file, 'r', encoding='utf-8') as f:
-            content = f.read()
-            
-        js_files = [
-            ('static/src/js/commit_browser.js', 'git_timesheet_mapper.CommitBrowser'),
-            ('static/src/js/bulk_mapper.js', 'git_timesheet_mapper.BulkMapper'),
-        ]
-        
-        for js_file, template_name in js_files:
-            full_path = project_root / 'git_timesheet_mapper' / js_file
-            if full_path.exists():
-                with open(full_path, 'r', encoding='utf-8') as f:
-                    js_content = f.read()
-                    if f'static template = "{template_name}"' not in js_content:
-                        return False
-                    if template_name not in content:
-                        return False
+        # Component sources come from the shared cache, already read by the
+        # asset and JS checks
+        for js_file, marker, template_name in _TEMPLATE_BINDINGS:
+            js_content = self._read(js_file)
+            if js_content is None:
+                continue
+            if marker not in js_content or template_name not in content:
+                return False
         return True
         
     def validate_responsive_design(self):
         """Validate responsive design implementation."""
         self.logger.info("Validating responsive design...")
         
-        css_file = project_root / 'git_timesheet_mapper' / 'static/src/css/styles.css'
+        content = self._read('static/src/css/styles.css')
         
-        if not css_file.exists():
+        if content is None:
             self.validation_results['responsive_design']['status'] = 'failed'
             self.validation_results['responsive_design']['details'] = {
                 'error': 'CSS file not found'
             }
             return
             
-        with open(css_file, 'r', encoding='utf-8') as f:
-            content = f.read()
-            
+        found = _RESPONSIVE_NEEDLES.found(content)
         responsive_checks = {
-            'media_queries': '@media' in content,
-            'mobile_breakpoint': '768px' in content,
-            'flexible_layout': 'flex' in content,
-            'responsive_grid': 'grid' in content or 'flex' in content,
-            'viewport_units': 'vw' in content or 'vh' in content or '%' in content,
+            'media_queries': b'@media' in found,
+            'mobile_breakpoint': b'768px' in found,
+            'flexible_layout': b'flex' in found,
+            'responsive_grid': b'grid' in found or b'flex' in found,
+            'viewport_units': b'vw' in found or b'vh' in found or b'%' in found,
         }
         
         failed_checks = [check for check, passed in responsive_checks.items() if not passed]
@@ -369,14 +454,14 @@ class IntegrationValidator:
                 'total_checks': len(responsive_checks)
             }
             
-        self.logger.info(f"Responsive design validation: {self.validation_results['responsive_design']['status']}")
+        self.logger.info("Responsive design validation: %s", self.validation_results['responsive_design']['status'])
         
     def validate_accessibility(self):
         """Validate accessibility implementation."""
         self.logger.info("Validating accessibility...")
         
-        template_file = project_root / 'git_timesheet_mapper' / 'static/src/xml/templates.xml'
-        css_file = project_root / 'git_timesheet_mapper' / 'static/src/css/styles.css'
+        template_file = 'static/src/xml/templates.xml'
+        css_file = 'static/src/css/styles.css'
         
         accessibility_checks = {
             'semantic_html': self._check_semantic_html(template_file),
@@ -402,62 +487,49 @@ class IntegrationValidator:
                 'total_checks': len(accessibility_checks)
             }
             
-        self.logger.info(f"Accessibility validation: {self.validation_results['accessibility']['status']}")
+        self.logger.info("Accessibility validation: %s", self.validation_results['accessibility']['status'])
         
     def _check_semantic_html(self, template_file):
         """Check for semantic HTML elements."""
-        if not template_file.exists():
+        content = self._read(template_file)
+        if content is None:
             return False
             
-        with open(template_file, 'r', encoding='utf-8') as f:
-            content = f.read()
-            
-        semantic_elements = ['<button', '<label', '<input', '<select', '<table', '<th', '<td']
-        return any(element in content for element in semantic_elements)
+        return _SEMANTIC_NEEDLES.any_in(content)
         
     def _check_aria_attributes(self, template_file):
         """Check for ARIA attributes."""
-        if not template_file.exists():
+        content = self._read(template_file)
+        if content is None:
             return False
             
-        with open(template_file, 'r', encoding='utf-8') as f:
-            content = f.read()
-            
-        aria_attributes = ['aria-', 'role=', 't-att-aria', 'aria-label', 'aria-describedby']
-        return any(attr in content for attr in aria_attributes)
+        return _ARIA_NEEDLES.any_in(content)
         
     def _check_keyboard_navigation(self, template_file):
         """Check for keyboard navigation support."""
-        if not template_file.exists():
+        content = self._read(template_file)
+        if content is None:
             return False
             
-        with open(template_file, 'r', encoding='utf-8') as f:
-            content = f.read()
-            
         # Look for tabindex, focus events, or keyboard event handlers
-        keyboard_features = ['tabindex', 't-on-keydown', 't-on-keyup', 't-on-keypress', 'focus']
-        return any(feature in content for feature in keyboard_features)
+        return _KEYBOARD_NEEDLES.any_in(content)
         
     def _check_color_contrast(self, css_file):
         """Check for color contrast considerations."""
-        if not css_file.exists():
+        content = self._read(css_file)
+        if content is None:
             return False
             
-        with open(css_file, 'r', encoding='utf-8') as f:
-            content = f.read()
-            
         # Look for color definitions and contrast considerations
-        return 'color:' in content and 'background' in content
+        return _CONTRAST_NEEDLES.all_in(content)
         
     def _check_focus_indicators(self, css_file):
         """Check for focus indicators."""
-        if not css_file.exists():
+        content = self._read(css_file)
+        if content is None:
             return False
             
-        with open(css_file, 'r', encoding='utf-8') as f:
-            content = f.read()
-            
-        return ':focus' in content
+        return b':focus' in content
         
     def validate_performance(self):
         """Validate performance considerations."""
@@ -486,64 +558,45 @@ class IntegrationValidator:
                 'total_checks': len(performance_checks)
             }
             
-        self.logger.info(f"Performance validation: {self.validation_results['performance']['status']}")
+        self.logger.info("Performance validation: %s", self.validation_results['performance']['status'])
         
     def _check_lazy_loading(self):
         """Check for lazy loading implementation."""
-        js_files = [
-            'static/src/js/commit_browser.js',
-            'static/src/js/bulk_mapper.js',
-        ]
-        
-        for file_path in js_files:
-            full_path = project_root / 'git_timesheet_mapper' / file_path
-            if full_path.exists():
-                with open(full_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                    if 'loading' in content or 'async' in content:
-                        return True
-        return False
+        if not self._assets_ok():
+            return False
+        return self._analyze_js_files()['has_async']
         
     def _check_efficient_selectors(self):
         """Check for efficient CSS selectors."""
-        css_file = project_root / 'git_timesheet_mapper' / 'static/src/css/styles.css'
-        if not css_file.exists():
+        content = self._read('static/src/css/styles.css')
+        if content is None:
             return False
             
-        with open(css_file, 'r', encoding='utf-8') as f:
-            content = f.read()
-            
         # Check for class-based selectors (more efficient than complex selectors)
-        class_selectors = content.count('.')
-        id_selectors = content.count('#')
-        complex_selectors = content.count(' > ') + content.count(' + ') + content.count(' ~ ')
+        # One scan: simple selectors yield an empty group, combinators do not
+        matches = _SELECTOR_RE.findall(content)
+        simple_selectors = matches.count(b'')
+        complex_selectors = len(matches) - simple_selectors
         
-        return (class_selectors + id_selectors) > complex_selectors
+        return simple_selectors > complex_selectors
         
     def _check_minimized_dom(self):
         """Check for minimized DOM structure."""
-        template_file = project_root / 'git_timesheet_mapper' / 'static/src/xml/templates.xml'
-        if not template_file.exists():
+        content = self._read('static/src/xml/templates.xml')
+        if content is None:
             return False
             
-        with open(template_file, 'r', encoding='utf-8') as f:
-            content = f.read()
-            
         # Look for conditional rendering and efficient templates
-        conditional_features = ['t-if=', 't-foreach=', 't-else=']
-        return any(feature in content for feature in conditional_features)
+        return _CONDITIONAL_NEEDLES.any_in(content)
         
     def _check_optimized_assets(self):
         """Check for optimized asset loading."""
-        assets_file = project_root / 'git_timesheet_mapper' / 'data/assets.xml'
-        if not assets_file.exists():
+        content = self._read('data/assets.xml')
+        if content is None:
             return False
             
-        with open(assets_file, 'r', encoding='utf-8') as f:
-            content = f.read()
-            
         # Check for proper bundling and sequencing
-        return 'bundle=' in content and 'sequence=' in content
+        return _ASSET_NEEDLES.all_in(content)
         
     def run_validation(self):
         """Run all validation checks."""
@@ -551,22 +604,30 @@ class IntegrationValidator:
         
         start_time = time.time()
         
-        # Run all validations
+        # Frontend assets go first: the component and lazy loading checks
+        # short-circuit on its result. The remaining stages are independent and
+        # mostly wait on file I/O, so run them side by side; each one writes
+        # only its own validation_results key.
         self.validate_frontend_assets()
-        self.validate_backend_apis()
-        self.validate_component_integration()
-        self.validate_responsive_design()
-        self.validate_accessibility()
-        self.validate_performance()
+        stages = [
+            self.validate_backend_apis,
+            self.validate_component_integration,
+            self.validate_responsive_design,
+            self.validate_accessibility,
+            self.validate_performance,
+        ]
+        with concurrent.futures.ThreadPoolExecutor(max_workers=len(stages)) as executor:
+            list(executor.map(lambda stage: stage(), stages))
         
         end_time = time.time()
         duration = end_time - start_time
         
         # Generate summary
         total_checks = len(self.validation_results)
-        passed_checks = sum(1 for result in self.validation_results.values() if result['status'] == 'passed')
-        failed_checks = sum(1 for result in self.validation_results.values() if result['status'] == 'failed')
-        warning_checks = sum(1 for result in self.validation_results.values() if result['status'] == 'warning')
+        status_counts = Counter(result['status'] for result in self.validation_results.values())
+        passed_checks = status_counts['passed']
+        failed_checks = status_counts['failed']
+        warning_checks = status_counts['warning']
         
         summary = {
             'total_checks': total_checks,
@@ -578,8 +639,9 @@ class IntegrationValidator:
             'details': self.validation_results
         }
         
-        self.logger.info(f"Validation completed in {duration:.2f} seconds")
-        self.logger.info(f"Results: {passed_checks} passed, {failed_checks} failed, {warning_checks} warnings")
+        self.logger.info("Validation completed in %.2f seconds", duration)
+        self.logger.info("Results: %d passed, %d failed, %d warnings",
+                         passed_checks, failed_checks, warning_checks)
         
         return summary
         
@@ -588,34 +650,41 @@ class IntegrationValidator:
         if output_file is None:
             output_file = project_root / 'validation_report.json'
             
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(summary, f, indent=2, default=str)
+        # The file is for tooling, the human-readable summary is printed below,
+        # so encode it compactly on the C fast path in a single write
+        Path(output_file).write_text(
+            json.dumps(summary, separators=(',', ':'), default=str),
+            encoding='utf-8',
+        )
             
-        self.logger.info(f"Validation report saved to: {output_file}")
-        
-        # Print summary to console
-        print("\n" + "="*60)
-        print("GIT TIMESHEET MAPPER - INTEGRATION VALIDATION REPORT")
-        print("="*60)
-        print(f"Overall Status: {summary['overall_status'].upper()}")
-        print(f"Total Checks: {summary['total_checks']}")
-        print(f"Passed: {summary['passed']}")
-        print(f"Failed: {summary['failed']}")
-        print(f"Warnings: {summary['warnings']}")
-        print(f"Duration: {summary['duration']} seconds")
-        print("\nDetailed Results:")
-        print("-" * 40)
+        self.logger.info("Validation report saved to: %s", output_file)
+        
+        # Print summary to console, collected into a single write
+        out = [
+            "\n" + "="*60,
+            "GIT TIMESHEET MAPPER - INTEGRATION VALIDATION REPORT",
+            "="*60,
+            f"Overall Status: {summary['overall_status'].upper()}",
+            f"Total Checks: {summary['total_checks']}",
+            f"Passed: {summary['passed']}",
+            f"Failed: {summary['failed']}",
+            f"Warnings: {summary['warnings']}",
+            f"Duration: {summary['duration']} seconds",
+            "\nDetailed Results:",
+            "-" * 40,
+        ]
         
         for check_name, result in summary['details'].items():
             status = result['status'].upper()
-            print(f"{check_name.replace('_', ' ').title()}: {status}")
+            out.append(f"{check_name.replace('_', ' ').title()}: {status}")
             
             if result['status'] == 'failed' and 'failed_checks' in result['details']:
                 failed = result['details']['failed_checks']
                 if failed:
-                    print(f"  Failed: {', '.join(failed)}")
+                    out.append(f"  Failed: {', '.join(failed)}")
                     
-        print("="*60)
+        out.append("="*60)
+        sys.stdout.write('\n'.join(out) + '\n')
         
         return output_file
 
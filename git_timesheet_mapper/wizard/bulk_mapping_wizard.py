@@ -2,10 +2,44 @@
 
 import logging
 from datetime import datetime, timedelta
+from psycopg2.extras import execute_values
 from odoo import models, fields, api, _
 from odoo.exceptions import ValidationError, UserError
+from odoo.tools import LazyTranslate
 
 _logger = logging.getLogger(__name__)
+_lt = LazyTranslate(__name__)
+
+# Upper bound on the commits listed (and counted) for selection
+AVAILABLE_COMMITS_LIMIT = 1000
+
+# Upper bound on the timesheet entries targeted by a project/task/employee mode
+TARGET_TIMESHEETS_LIMIT = 5000
+
+# Wizard title and fixed progress for each state; 'processing' progress is
+# derived from the mapping counters instead
+_WIZARD_TITLES = {
+    'select_commits': _lt('Step 1: Select Commits'),
+    'select_timesheet': _lt('Step 2: Select Timesheet Target'),
+    'preview': _lt('Step 3: Preview Mappings'),
+    'processing': _lt('Step 4: Processing Mappings'),
+    'complete': _lt('Bulk Mapping Complete'),
+}
+_PROGRESS = {
+    'select_commits': 20.0,
+    'select_timesheet': 40.0,
+    'preview': 60.0,
+    'complete': 100.0,
+}
+
+
+def _format_error(env, commit, timesheet, error_message):
+    """Return the error log line for a failed mapping."""
+    error_line = env._('Commit %s', commit.short_hash if commit else 'Unknown')
+    if timesheet:
+        error_line += env._(' -> Timesheet %s', timesheet.name)
+    error_line += env._(': %s\n', error_message)
+    return error_line
 
 
 class BulkMappingWizard(models.TransientModel):
@@ -102,8 +136,7 @@ class BulkMappingWizard(models.TransientModel):
         'wizard_id',
         'commit_id',
         string='Available Commits',
-        compute='_compute_available_commits',
-        store=False
+        help='Commits matching the filters, reloaded when a filter changes'
     )
     
     commit_count = fields.Integer(
@@ -114,8 +147,9 @@ class BulkMappingWizard(models.TransientModel):
     
     selected_commit_count = fields.Integer(
         string='Selected Commits',
-        compute='_compute_selected_commit_count',
-        store=False
+        default=0,
+        readonly=True,
+        help='Number of selected commits, refreshed on each step transition'
     )
     
     # Step 2: Timesheet Selection
@@ -190,8 +224,8 @@ class BulkMappingWizard(models.TransientModel):
         'bulk.mapping.preview',
         'wizard_id',
         string='Preview Mappings',
-        compute='_compute_preview_mappings',
-        store=False
+        readonly=True,
+        help='Filled when entering the preview step'
     )
     
     # Step 4: Processing Results
@@ -221,146 +255,123 @@ class BulkMappingWizard(models.TransientModel):
     @api.depends('state')
     def _compute_wizard_title(self):
         """Compute dynamic wizard title based on current state."""
-        titles = {
-            'select_commits': _('Step 1: Select Commits'),
-            'select_timesheet': _('Step 2: Select Timesheet Target'),
-            'preview': _('Step 3: Preview Mappings'),
-            'processing': _('Step 4: Processing Mappings'),
-            'complete': _('Bulk Mapping Complete')
-        }
         for wizard in self:
-            wizard.wizard_title = titles.get(wizard.state, _('Bulk Mapping Wizard'))
+            title = _WIZARD_TITLES.get(wizard.state)
+            wizard.wizard_title = str(title) if title else _('Bulk Mapping Wizard')
     
-    @api.depends('state', 'selected_commit_count', 'mappings_created', 'mappings_failed')
+    @api.depends('state', 'mappings_created', 'mappings_failed')
     def _compute_progress(self):
         """Compute progress percentage based on current state."""
         for wizard in self:
-            if wizard.state == 'select_commits':
-                wizard.progress_percentage = 20.0
-            elif wizard.state == 'select_timesheet':
-                wizard.progress_percentage = 40.0
-            elif wizard.state == 'preview':
-                wizard.progress_percentage = 60.0
-            elif wizard.state == 'processing':
-                if wizard.selected_commit_count > 0:
-                    completed = wizard.mappings_created + wizard.mappings_failed
-                    wizard.progress_percentage = 60.0 + (completed / wizard.selected_commit_count * 30.0)
-                else:
-                    wizard.progress_percentage = 80.0
-            elif wizard.state == 'complete':
-                wizard.progress_percentage = 100.0
+            if wizard.state != 'processing':
+                wizard.progress_percentage = _PROGRESS.get(wizard.state, 0.0)
+            elif wizard.selected_commit_count > 0:
+                completed = wizard.mappings_created + wizard.mappings_failed
+                wizard.progress_percentage = 60.0 + (completed / wizard.selected_commit_count * 30.0)
             else:
-                wizard.progress_percentage = 0.0
+                wizard.progress_percentage = 80.0
     
     @api.depends('repository_id', 'branch_name', 'commit_date_from', 'commit_date_to', 
                  'commit_author', 'commit_type', 'only_unmapped')
-    def _compute_available_commits(self):
-        """Compute available commits based on filter criteria."""
+    def _compute_commit_count(self):
+        """Compute number of available commits.
+
+        Only counts the matching commits; the list itself is filled by the
+        filter onchange, so nothing else recomputes from it.
+        """
         for wizard in self:
             if not wizard.repository_id:
-                wizard.available_commit_ids = [(6, 0, [])]
+                wizard.commit_count = 0
                 continue
-            
-            domain = [('repository_id', '=', wizard.repository_id.id)]
-            
-            if wizard.branch_name:
-                domain.append(('branch_name', '=', wizard.branch_name))
-            
-            if wizard.commit_date_from:
-                domain.append(('commit_date', '>=', wizard.commit_date_from))
-            
-            if wizard.commit_date_to:
-                domain.append(('commit_date', '<=', wizard.commit_date_to))
-            
-            if wizard.commit_author:
-                domain.extend(['|', 
-                              ('author_name', 'ilike', wizard.commit_author),
-                              ('author_email', 'ilike', wizard.commit_author)])
-            
-            if wizard.commit_type:
-                domain.append(('commit_type', '=', wizard.commit_type))
-            
-            if wizard.only_unmapped:
-                domain.append(('is_mapped', '=', False))
-            
-            commits = self.env['git.commit'].search(domain, limit=1000, order='commit_date desc')
-            wizard.available_commit_ids = [(6, 0, commits.ids)]
+            wizard.commit_count = self.env['git.commit'].search_count(
+                wizard._get_commit_domain(), limit=AVAILABLE_COMMITS_LIMIT
+            )
     
-    @api.depends('available_commit_ids')
-    def _compute_commit_count(self):
-        """Compute number of available commits."""
-        for wizard in self:
-            wizard.commit_count = len(wizard.available_commit_ids)
+    def _get_commit_domain(self):
+        """Build the git.commit search domain from the filter criteria."""
+        self.ensure_one()
+        domain = [('repository_id', '=', self.repository_id.id)]
+        
+        if self.branch_name:
+            domain.append(('branch_name', '=', self.branch_name))
+        
+        if self.commit_date_from:
+            domain.append(('commit_date', '>=', self.commit_date_from))
+        
+        if self.commit_date_to:
+            domain.append(('commit_date', '<=', self.commit_date_to))
+        
+        if self.commit_author:
+            domain.extend(['|', 
+                          ('author_name', 'ilike', self.commit_author),
+                          ('author_email', 'ilike', self.commit_author)])
+        
+        if self.commit_type:
+            domain.append(('commit_type', '=', self.commit_type))
+        
+        if self.only_unmapped:
+            domain.append(('is_mapped', '=', False))
+        
+        return domain
     
-    @api.depends('selected_commit_ids')
-    def _compute_selected_commit_count(self):
-        """Compute number of selected commits."""
-        for wizard in self:
-            wizard.selected_commit_count = len(wizard.selected_commit_ids)
+    @api.onchange('repository_id', 'branch_name', 'commit_date_from', 'commit_date_to',
+                  'commit_author', 'commit_type', 'only_unmapped')
+    def _onchange_filters(self):
+        """Reload the available commits once per filter edit."""
+        self._refresh_available()
     
-    @api.depends('timesheet_selection_mode', 'target_timesheet_id', 'target_project_id',
+    def _refresh_available(self):
+        """Fill available_commit_ids from the current filter criteria."""
+        self.available_commit_ids = self._search_available_commits()
+    
+    def _search_available_commits(self):
+        """Return the commits matching the filter criteria, newest first."""
+        self.ensure_one()
+        if not self.repository_id:
+            return self.env['git.commit']
+        return self.env['git.commit'].search(
+            self._get_commit_domain(), limit=AVAILABLE_COMMITS_LIMIT, order='commit_date desc'
+        )
+    
+    @api.depends('state', 'timesheet_selection_mode', 'target_timesheet_id', 'target_project_id',
                  'target_task_id', 'target_employee_id', 'timesheet_date_from', 'timesheet_date_to')
     def _compute_target_timesheets(self):
         """Compute target timesheet entries based on selection mode."""
         for wizard in self:
-            domain = [('project_id', '!=', False)]
-            
-            if wizard.timesheet_date_from:
-                domain.append(('date', '>=', wizard.timesheet_date_from))
-            
-            if wizard.timesheet_date_to:
-                domain.append(('date', '<=', wizard.timesheet_date_to))
+            # Nothing reads the targets before step 2, so skip the search
+            # while the user is still filtering commits
+            if wizard.state not in ('select_timesheet', 'preview', 'processing'):
+                wizard.target_timesheet_ids = [(6, 0, [])]
+                continue
             
             if wizard.timesheet_selection_mode == 'single':
-                if wizard.target_timesheet_id:
-                    wizard.target_timesheet_ids = [(6, 0, [wizard.target_timesheet_id.id])]
-                else:
-                    wizard.target_timesheet_ids = [(6, 0, [])]
+                wizard.target_timesheet_ids = [(6, 0, wizard.target_timesheet_id.ids)]
+                continue
             
-            elif wizard.timesheet_selection_mode == 'project':
-                if wizard.target_project_id:
-                    domain.append(('project_id', '=', wizard.target_project_id.id))
-                    timesheets = self.env['account.analytic.line'].search(domain)
-                    wizard.target_timesheet_ids = [(6, 0, timesheets.ids)]
-                else:
-                    wizard.target_timesheet_ids = [(6, 0, [])]
+            target_field, target = {
+                'project': ('project_id', wizard.target_project_id),
+                'task': ('task_id', wizard.target_task_id),
+                'employee': ('employee_id', wizard.target_employee_id),
+            }.get(wizard.timesheet_selection_mode, (None, None))
             
-            elif wizard.timesheet_selection_mode == 'task':
-                if wizard.target_task_id:
-                    domain.append(('task_id', '=', wizard.target_task_id.id))
-                    timesheets = self.env['account.analytic.line'].search(domain)
-                    wizard.target_timesheet_ids = [(6, 0, timesheets.ids)]
-                else:
-                    wizard.target_timesheet_ids = [(6, 0, [])]
+            # Nothing to search until the mode's target has been chosen
+            if not target:
+                wizard.target_timesheet_ids = [(6, 0, [])]
+                continue
             
-            elif wizard.timesheet_selection_mode == 'employee':
-                if wizard.target_employee_id:
-                    domain.append(('employee_id', '=', wizard.target_employee_id.id))
-                    timesheets = self.env['account.analytic.line'].search(domain)
-                    wizard.target_timesheet_ids = [(6, 0, timesheets.ids)]
-                else:
-                    wizard.target_timesheet_ids = [(6, 0, [])]
-    
-    @api.depends('selected_commit_ids', 'target_timesheet_ids', 'mapping_method')
-    def _compute_preview_mappings(self):
-        """Compute preview of mappings to be created."""
-        for wizard in self:
-            preview_lines = []
+            domain = [('project_id', '!=', False), (target_field, '=', target.id)]
             
-            if wizard.selected_commit_ids and wizard.target_timesheet_ids:
-                # Simple 1:1 mapping for preview (can be enhanced with smart matching)
-                for i, commit in enumerate(wizard.selected_commit_ids):
-                    timesheet_index = i % len(wizard.target_timesheet_ids)
-                    timesheet = wizard.target_timesheet_ids[timesheet_index]
-                    
-                    preview_lines.append((0, 0, {
-                        'commit_id': commit.id,
-                        'timesheet_id': timesheet.id,
-                        'confidence_score': self._calculate_confidence_score(commit, timesheet),
-                        'mapping_method': wizard.mapping_method,
-                    }))
+            if wizard.timesheet_date_from:
+                domain.append(('date', '>=', wizard.timesheet_date_from))
             
-            wizard.preview_mapping_ids = preview_lines
+            if wizard.timesheet_date_to:
+                domain.append(('date', '<=', wizard.timesheet_date_to))
+            
+            # Only the ids are needed, so skip loading the timesheet records
+            timesheet_ids = self.env['account.analytic.line']._search(
+                domain, limit=TARGET_TIMESHEETS_LIMIT
+            )
+            wizard.target_timesheet_ids = [(6, 0, list(timesheet_ids))]
     
     # Selection Methods
     def _get_branch_selection(self):
@@ -368,11 +379,13 @@ class BulkMappingWizard(models.TransientModel):
         if not self.repository_id:
             return []
         
-        branches = self.env['git.commit'].search([
-            ('repository_id', '=', self.repository_id.id)
-        ]).mapped('branch_name')
+        # Group in the database so only the distinct branch names come back
+        groups = self.env['git.commit']._read_group([
+            ('repository_id', '=', self.repository_id.id),
+            ('branch_name', '!=', False)
+        ], groupby=['branch_name'], order='branch_name')
         
-        return [(branch, branch) for branch in sorted(set(branches)) if branch]
+        return [(branch, branch) for branch, in groups]
     
     # Navigation Methods
     def action_next_step(self):
@@ -380,7 +393,7 @@ class BulkMappingWizard(models.TransientModel):
         self.ensure_one()
         
         if self.state == 'select_commits':
-            if not self.selected_commit_ids:
+            if not self._count_selected_commits():
                 raise ValidationError(_('Please select at least one commit.'))
             self.state = 'select_timesheet'
         
@@ -388,6 +401,7 @@ class BulkMappingWizard(models.TransientModel):
             if not self.target_timesheet_ids:
                 raise ValidationError(_('Please select target timesheet entries.'))
             self.state = 'preview'
+            self._refresh_preview()
         
         elif self.state == 'preview':
             self.state = 'processing'
@@ -423,17 +437,112 @@ class BulkMappingWizard(models.TransientModel):
     def action_select_all_commits(self):
         """Select all available commits."""
         self.ensure_one()
-        self.selected_commit_ids = [(6, 0, self.available_commit_ids.ids)]
+        commits = self._search_available_commits()
+        self.available_commit_ids = commits
+        self._set_selected_commits(commits.ids)
     
     def action_deselect_all_commits(self):
         """Deselect all commits."""
         self.ensure_one()
-        self.selected_commit_ids = [(6, 0, [])]
+        self._set_selected_commits([])
+    
+    def _set_selected_commits(self, commit_ids):
+        """Replace the selected commits with two statements.
+        
+        The ids must come from an ORM search, which already applied the
+        access rules; the relation rows are then rewritten with one DELETE
+        and one multi-row INSERT instead of one statement per commit.
+        """
+        self.ensure_one()
+        self.flush_recordset(['selected_commit_ids'])
+        cr = self.env.cr
+        cr.execute('DELETE FROM wizard_commit_rel WHERE wizard_id = %s', (self.id,))
+        if commit_ids:
+            execute_values(
+                cr,
+                'INSERT INTO wizard_commit_rel (wizard_id, commit_id) VALUES %s',
+                [(self.id, commit_id) for commit_id in commit_ids]
+            )
+        # Drop the cached selection and every value computed from it
+        self.invalidate_recordset()
+        self.selected_commit_count = len(commit_ids)
+    
+    def _count_selected_commits(self):
+        """Store and return the number of selected commits.
+        
+        Counted straight from the relation table once per step transition,
+        instead of recomputing it on every change to the selection.
+        """
+        self.ensure_one()
+        self.flush_recordset(['selected_commit_ids'])
+        self.env.cr.execute(
+            'SELECT COUNT(*) FROM wizard_commit_rel WHERE wizard_id = %s', (self.id,)
+        )
+        self.selected_commit_count = self.env.cr.fetchone()[0]
+        return self.selected_commit_count
     
     def action_refresh_commits(self):
         """Refresh available commits based on current filters."""
         self.ensure_one()
-        self._compute_available_commits()
+        self._refresh_available()
+    
+    def _refresh_preview(self):
+        """Rebuild the preview of mappings to be created.
+        
+        The lines are stored once per visit of the preview step, replaced
+        with one DELETE and one multi-row INSERT instead of being rebuilt
+        by a compute on every read of the form.
+        """
+        self.ensure_one()
+        rows = []
+        
+        if self.selected_commit_ids and self.target_timesheet_ids:
+            # Read the scoring inputs once as plain values, one query per
+            # model, so the loop below never goes through record attributes
+            commits = [
+                (c['id'], c['commit_date'] and c['commit_date'].date(), (c['author_email'] or '').lower())
+                for c in self.selected_commit_ids.read(['commit_date', 'author_email'], load=None)
+            ]
+            timesheet_rows = self.target_timesheet_ids.read(['date', 'employee_id'], load=None)
+            employee_emails = {
+                e['id']: (e['work_email'] or '').lower()
+                for e in self.env['hr.employee'].browse(
+                    {t['employee_id'] for t in timesheet_rows if t['employee_id']}
+                ).read(['work_email'], load=None)
+            }
+            timesheets = [
+                (t['id'], t['date'], employee_emails.get(t['employee_id'], ''))
+                for t in timesheet_rows
+            ]
+            
+            # Simple 1:1 mapping for preview (can be enhanced with smart matching)
+            for i, (commit_id, commit_day, author_email) in enumerate(commits):
+                timesheet_id, timesheet_date, employee_email = timesheets[i % len(timesheets)]
+                rows.append((
+                    self.id, commit_id, timesheet_id,
+                    self._calculate_confidence_score(
+                        commit_day, author_email, timesheet_date, employee_email
+                    ),
+                    self.env.uid, self.env.uid,
+                ))
+        
+        self.flush_recordset()
+        cr = self.env.cr
+        cr.execute('DELETE FROM bulk_mapping_preview WHERE wizard_id = %s', (self.id,))
+        if rows:
+            execute_values(
+                cr,
+                """
+                INSERT INTO bulk_mapping_preview
+                    (wizard_id, commit_id, timesheet_id, confidence_score,
+                     create_uid, write_uid, create_date, write_date)
+                VALUES %s
+                """,
+                rows,
+                template="(%s, %s, %s, %s, %s, %s, now() at time zone 'UTC', now() at time zone 'UTC')"
+            )
+        self.env['bulk.mapping.preview'].invalidate_model()
+        self.invalidate_recordset(['preview_mapping_ids'])
     
     # Processing Methods
     def action_process_mappings(self):
@@ -441,53 +550,53 @@ class BulkMappingWizard(models.TransientModel):
         self.ensure_one()
         
         try:
-            self.processing_status = _('Starting bulk mapping process...')
-            self.mappings_created = 0
-            self.mappings_failed = 0
+            commits = self.selected_commit_ids
+            timesheets = self.target_timesheet_ids
             
-            mapping_service = self.env['mapping.service']
+            # Build every mapping up front (target selection can be enhanced
+            # with smart matching) and create them in a single batch
+            # Index plain id lists rather than re-wrapping a record per commit
+            timesheet_ids = timesheets.ids
+            vals_list = [{
+                'commit_id': commit_id,
+                'timesheet_line_id': timesheet_ids[i % len(timesheet_ids)],
+                'description': self.mapping_description,
+                'mapping_method': self.mapping_method,
+            } for i, commit_id in enumerate(commits.ids)]
             
-            # Process mappings
-            for i, commit in enumerate(self.selected_commit_ids):
-                try:
-                    # Select target timesheet (can be enhanced with smart matching)
-                    timesheet_index = i % len(self.target_timesheet_ids)
-                    timesheet = self.target_timesheet_ids[timesheet_index]
-                    
-                    self.processing_status = _(
-                        'Processing mapping %d of %d: %s -> %s'
-                    ) % (i + 1, len(self.selected_commit_ids), 
-                         commit.short_hash, timesheet.name)
-                    
-                    # Create mapping
-                    result = mapping_service.create_mapping(
-                        commit_id=commit.id,
-                        timesheet_line_id=timesheet.id,
-                        description=self.mapping_description,
-                        mapping_method=self.mapping_method,
-                        auto_verify=self.auto_verify
-                    )
-                    
-                    if result['success']:
-                        self.mappings_created += 1
-                    else:
-                        self.mappings_failed += 1
-                        self._log_error(commit, timesheet, result['error'])
-                
-                except Exception as e:
-                    self.mappings_failed += 1
-                    self._log_error(commit, None, str(e))
-                    _logger.error(f"Bulk mapping error for commit {commit.commit_hash}: {str(e)}")
+            created_ids, errors = self.env['mapping.service'].create_mappings(vals_list)
+            created = len(created_ids)
+            failed = len(errors)
             
-            self.processing_status = _(
-                'Bulk mapping complete. Created: %d, Failed: %d'
-            ) % (self.mappings_created, self.mappings_failed)
+            # Collect the error lines locally and store them with the results;
+            # rows the service could not find are reported without a record
+            commit_by_id = {commit.id: commit for commit in commits}
+            timesheet_by_id = {timesheet.id: timesheet for timesheet in timesheets}
+            error_lines = [
+                _format_error(
+                    self.env,
+                    commit_by_id.get(error['commit_id']),
+                    timesheet_by_id.get(error['timesheet_line_id']),
+                    error['error']
+                )
+                for error in errors
+            ]
             
-            self.state = 'complete'
+            self.write({
+                'mappings_created': created,
+                'mappings_failed': failed,
+                'error_log': ''.join(error_lines) or False,
+                'processing_status': _(
+                    'Bulk mapping complete. Created: %d, Failed: %d'
+                ) % (created, failed),
+                'state': 'complete',
+            })
             
         except Exception as e:
-            self.processing_status = _('Error during bulk mapping: %s') % str(e)
-            self.state = 'complete'
+            self.write({
+                'processing_status': _('Error during bulk mapping: %s') % str(e),
+                'state': 'complete',
+            })
             _logger.error(f"Bulk mapping wizard error: {str(e)}")
         
         return {
@@ -519,13 +628,18 @@ class BulkMappingWizard(models.TransientModel):
         }
     
     # Utility Methods
-    def _calculate_confidence_score(self, commit, timesheet):
-        """Calculate confidence score for a commit-timesheet mapping."""
+    def _calculate_confidence_score(self, commit_day, author_email, timesheet_date, employee_email):
+        """Calculate confidence score for a commit-timesheet mapping.
+        
+        Works on plain values: the commit date (as a date), the lower-cased
+        author email, the timesheet date and the lower-cased employee work
+        email, each falsy when unknown.
+        """
         score = 50.0  # Base score
         
         # Date proximity
-        if commit.commit_date and timesheet.date:
-            date_diff = abs((commit.commit_date.date() - timesheet.date).days)
+        if commit_day and timesheet_date:
+            date_diff = abs((commit_day - timesheet_date).days)
             if date_diff <= 1:
                 score += 30.0
             elif date_diff <= 7:
@@ -534,24 +648,10 @@ class BulkMappingWizard(models.TransientModel):
                 score += 10.0
         
         # Author matching
-        if timesheet.employee_id and commit.author_email:
-            employee_email = timesheet.employee_id.work_email
-            if employee_email and employee_email.lower() == commit.author_email.lower():
-                score += 20.0
+        if employee_email and employee_email == author_email:
+            score += 20.0
         
         return min(score, 100.0)
-    
-    def _log_error(self, commit, timesheet, error_message):
-        """Log error for failed mapping."""
-        error_line = _('Commit %s') % (commit.short_hash if commit else 'Unknown')
-        if timesheet:
-            error_line += _(' -> Timesheet %s') % timesheet.name
-        error_line += _(': %s\n') % error_message
-        
-        if self.error_log:
-            self.error_log += error_line
-        else:
-            self.error_log = error_line
 
 
 class BulkMappingPreview(models.TransientModel):
@@ -563,16 +663,47 @@ class BulkMappingPreview(models.TransientModel):
     commit_id = fields.Many2one('git.commit', string='Commit', required=True)
     timesheet_id = fields.Many2one('account.analytic.line', string='Timesheet', required=True)
     confidence_score = fields.Float(string='Confidence', default=50.0)
-    mapping_method = fields.Selection([
-        ('manual', 'Manual'),
-        ('bulk', 'Bulk'),
-        ('automatic', 'Automatic')
-    ], string='Method', default='bulk')
+    mapping_method = fields.Selection(related='wizard_id.mapping_method', string='Method')
     
     # Display fields
-    commit_hash = fields.Char(related='commit_id.short_hash', string='Hash')
-    commit_message = fields.Char(related='commit_id.commit_message_short', string='Message')
-    commit_author = fields.Char(related='commit_id.author_name', string='Author')
-    timesheet_name = fields.Char(related='timesheet_id.name', string='Timesheet')
-    project_name = fields.Char(related='timesheet_id.project_id.name', string='Project')
-    task_name = fields.Char(related='timesheet_id.task_id.name', string='Task')
+    commit_hash = fields.Char(string='Hash', compute='_compute_display_fields')
+    commit_message = fields.Char(string='Message', compute='_compute_display_fields')
+    commit_author = fields.Char(string='Author', compute='_compute_display_fields')
+    timesheet_name = fields.Char(string='Timesheet', compute='_compute_display_fields')
+    project_name = fields.Char(string='Project', compute='_compute_display_fields')
+    task_name = fields.Char(string='Task', compute='_compute_display_fields')
+    
+    @api.depends('commit_id.short_hash', 'commit_id.commit_message_short', 'commit_id.author_name',
+                 'timesheet_id.name', 'timesheet_id.project_id.name', 'timesheet_id.task_id.name')
+    def _compute_display_fields(self):
+        """Compute the display columns from one batched read per model."""
+        commits = {
+            c['id']: c for c in
+            self.mapped('commit_id').read(['short_hash', 'commit_message_short', 'author_name'], load=None)
+        }
+        timesheets = {
+            t['id']: t for t in
+            self.mapped('timesheet_id').read(['name', 'project_id', 'task_id'], load=None)
+        }
+        projects = {
+            p['id']: p['name'] for p in
+            self.env['project.project'].browse(
+                {t['project_id'] for t in timesheets.values() if t['project_id']}
+            ).read(['name'], load=None)
+        }
+        tasks = {
+            t['id']: t['name'] for t in
+            self.env['project.task'].browse(
+                {t['task_id'] for t in timesheets.values() if t['task_id']}
+            ).read(['name'], load=None)
+        }
+        
+        for line in self:
+            commit = commits.get(line.commit_id.id, {})
+            timesheet = timesheets.get(line.timesheet_id.id, {})
+            line.commit_hash = commit.get('short_hash')
+            line.commit_message = commit.get('commit_message_short')
+            line.commit_author = commit.get('author_name')
+            line.timesheet_name = timesheet.get('name')
+            line.project_name = projects.get(timesheet.get('project_id'))
+            line.task_name = tasks.get(timesheet.get('task_id'))
@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+Run the Git Timesheet Mapper test suite against a cached template database.
+
+Installing base + project + hr_timesheet + the addon dominates the wall time
+of the integration tests, so when GIT_TIMESHEET_CACHE_TEST_DB=1 the freshly
+installed database is dumped to var/test-db-caches/ and restored on later
+runs instead of being rebuilt. The cache key is a hash of __manifest__.py and
+the test file mtimes, so touching either rebuilds it. Caching is always
+disabled when CI is set, to keep CI results authoritative.
+
+The cached runs never touch the database named with -d: they drop, restore
+and test a dedicated "<db>_test_cache" database instead, on the server given
+by the odoo-bin --db_host/--db_port/--db_user/--db_password options.
+
+Usage:
+    GIT_TIMESHEET_CACHE_TEST_DB=1 python3 test_db_cache.py -d <db> [odoo-bin args...]
+    python3 test_db_cache.py --remove-cache
+
+The odoo-bin executable is taken from $ODOO_BIN (default: odoo-bin).
+"""
+
+import sys
+import os
+import glob
+import hashlib
+import shutil
+import subprocess
+
+ADDON_NAME = 'git_timesheet_mapper'
+CACHE_DIR = os.path.join('var', 'test-db-caches')
+CACHE_DB_SUFFIX = '_test_cache'
+
+# odoo-bin connection options and the libpq tool flag each one maps to
+PG_OPTIONS = (
+    (('--db_host',), '--host'),
+    (('--db_port',), '--port'),
+    (('-r', '--db_user'), '--username'),
+)
+PASSWORD_OPTIONS = ('-w', '--db_password')
+DATABASE_OPTIONS = ('-d', '--database')
+
+def cache_enabled():
+    """Return True when the template database cache should be used."""
+    return os.environ.get('GIT_TIMESHEET_CACHE_TEST_DB') == '1' and not os.environ.get('CI')
+
+def cache_key(addon_path):
+    """Hash the manifest contents and the test file mtimes into a cache key."""
+    digest = hashlib.sha256()
+    with open(os.path.join(addon_path, '__manifest__.py'), 'rb') as f:
+        digest.update(f.read())
+    for test_file in sorted(glob.glob(os.path.join(addon_path, 'tests', '*.py'))):
+        digest.update(test_file.encode())
+        digest.update(str(os.stat(test_file).st_mtime_ns).encode())
+    return digest.hexdigest()[:16]
+
+def remove_cache():
+    """Delete every cached template database dump."""
+    if os.path.isdir(CACHE_DIR):
+        shutil.rmtree(CACHE_DIR)
+        print(f"Removed test database cache: {CACHE_DIR}")
+    else:
+        print("No test database cache to remove")
+
+def get_option(args, names):
+    """Return the value of the first odoo-bin option in names, or None."""
+    for i, arg in enumerate(args):
+        for name in names:
+            if arg == name and i + 1 < len(args):
+                return args[i + 1]
+            if name.startswith('--') and arg.startswith(name + '='):
+                return arg.split('=', 1)[1]
+    return None
+
+def parse_database(args):
+    """Extract the database name from the odoo-bin arguments."""
+    return get_option(args, DATABASE_OPTIONS)
+
+def replace_database(args, database):
+    """Return a copy of the odoo-bin arguments pointing at another database."""
+    result = []
+    skip_next = False
+    for i, arg in enumerate(args):
+        if skip_next:
+            skip_next = False
+        elif arg in DATABASE_OPTIONS and i + 1 < len(args):
+            result += [arg, database]
+            skip_next = True
+        elif arg.startswith('--database='):
+            result.append(f"--database={database}")
+        else:
+            result.append(arg)
+    return result
+
+def pg_connection(args):
+    """Return (flags, env) pointing the pg tools at the server odoo-bin uses."""
+    flags = []
+    for names, pg_flag in PG_OPTIONS:
+        value = get_option(args, names)
+        if value:
+            flags += [pg_flag, value]
+    env = dict(os.environ)
+    password = get_option(args, PASSWORD_OPTIONS)
+    if password:
+        env['PGPASSWORD'] = password
+    return flags, env
+
+def mask_passwords(cmd):
+    """Return a copy of cmd with every password option value replaced by ***."""
+    masked = []
+    hide_next = False
+    for arg in cmd:
+        if hide_next:
+            masked.append('***')
+            hide_next = False
+        elif arg in PASSWORD_OPTIONS:
+            masked.append(arg)
+            hide_next = True
+        elif arg.startswith('--db_password='):
+            masked.append('--db_password=***')
+        else:
+            masked.append(arg)
+    return masked
+
+def run(cmd, env=None):
+    """Run a command, echoing it first with passwords masked, and return its exit code."""
+    print("$ " + " ".join(mask_passwords(cmd)))
+    try:
+        return subprocess.call(cmd, env=env)
+    except FileNotFoundError:
+        print(f"Error: Command '{cmd[0]}' not found (set $ODOO_BIN or check PATH)")
+        sys.exit(1)
+
+def main():
+    """Main entry point."""
+    args = sys.argv[1:]
+    if '--remove-cache' in args:
+        remove_cache()
+        sys.exit(0)
+
+    addon_path = ADDON_NAME
+    if not os.path.exists(addon_path):
+        print(f"Error: Addon directory '{addon_path}' not found")
+        sys.exit(1)
+
+    odoo_bin = os.environ.get('ODOO_BIN', 'odoo-bin')
+    test_args = ['--test-enable', '--test-tags', f"/{ADDON_NAME}", '--stop-after-init']
+
+    database = parse_database(args)
+    if not cache_enabled() or database is None:
+        # Plain run: install the addon and let odoo-bin run the tests
+        sys.exit(run([odoo_bin, *args, '-i', ADDON_NAME, *test_args]))
+
+    # Only ever drop and restore the database this script owns
+    cache_db = database + CACHE_DB_SUFFIX
+    odoo_args = replace_database(args, cache_db)
+    pg_flags, pg_env = pg_connection(args)
+    print(f"Using dedicated test database '{cache_db}'")
+
+    def drop_cache_db():
+        if run(['dropdb', *pg_flags, '--if-exists', cache_db], env=pg_env):
+            print(f"❌ Could not drop the test database '{cache_db}'")
+            sys.exit(1)
+
+    dump_path = os.path.join(CACHE_DIR, f"{ADDON_NAME}-{cache_key(addon_path)}.dump")
+
+    if os.path.exists(dump_path):
+        print(f"Restoring cached test database from {dump_path}")
+        drop_cache_db()
+        if (run(['createdb', *pg_flags, cache_db], env=pg_env)
+                or run(['pg_restore', *pg_flags, '--no-owner', '-d', cache_db, dump_path], env=pg_env)):
+            print("❌ Could not restore the cached database, run with --remove-cache")
+            sys.exit(1)
+    else:
+        # Build the template once, without tests, and snapshot it
+        drop_cache_db()
+        if run([odoo_bin, *odoo_args, '-i', ADDON_NAME, '--stop-after-init']):
+            sys.exit(1)
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        for stale in glob.glob(os.path.join(CACHE_DIR, f"{ADDON_NAME}-*.dump")):
+            os.remove(stale)
+        # Dump under a temporary name so a failed dump never looks like a cache
+        tmp_path = dump_path + '.tmp'
+        if run(['pg_dump', *pg_flags, '-Fc', '-f', tmp_path, cache_db], env=pg_env):
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            print("⚠️  Could not write the test database cache")
+        else:
+            os.replace(tmp_path, dump_path)
+            print(f"Cached test database to {dump_path}")
+
+    # Update the addon in place so its tests run against the restored registry
+    sys.exit(run([odoo_bin, *odoo_args, '-u', ADDON_NAME, *test_args]))
+
+if __name__ == '__main__':
+    main()
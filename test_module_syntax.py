@@ -7,38 +7,37 @@ for the Git Timesheet Mapper addon.
 import sys
 import os
 import importlib.util
-import ast
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
 
 def test_python_file(file_path):
-    """Test if a Python file has valid syntax and can be parsed."""
+    """Test if a Python file has valid syntax and can be parsed.
+
+    Runs in a worker process, so the outcome is returned as
+    ``(file_path, ok, message)`` and printed by the parent in order.
+    """
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        # Hand the raw bytes straight to the compiler, which decodes them
+        # itself (honouring any coding cookie), so no decoded copy is kept
+        with open(file_path, 'rb') as f:
+            source = f.read()
         
-        # Check syntax
-        ast.parse(content, filename=file_path)
+        # Check syntax; the code object is discarded, no AST is kept around
+        compile(source, file_path, 'exec', dont_inherit=True)
         
-        print(f"✓ {file_path}: Syntax OK")
-        return True
+        return file_path, True, f"✓ {file_path}: Syntax OK"
     except SyntaxError as e:
-        print(f"✗ {file_path}: Syntax Error - {e}")
-        return False
+        return file_path, False, f"✗ {file_path}: Syntax Error - {e}"
     except Exception as e:
-        print(f"✗ {file_path}: Error - {e}")
-        return False
+        return file_path, False, f"✗ {file_path}: Error - {e}"
 
 def find_python_files(directory):
     """Find all Python files in a directory recursively."""
-    python_files = []
-    for root, dirs, files in os.walk(directory):
+    return [
+        str(path) for path in Path(directory).rglob('*.py')
         # Skip __pycache__ directories
-        dirs[:] = [d for d in dirs if d != '__pycache__']
-        
-        for file in files:
-            if file.endswith('.py'):
-                python_files.append(os.path.join(root, file))
-    
-    return python_files
+        if '__pycache__' not in path.parts
+    ]
 
 def main():
     """Main test function."""
@@ -56,8 +55,13 @@ def main():
     passed = 0
     failed = 0
     
-    for file_path in sorted(python_files):
-        if test_python_file(file_path):
+    # Files are independent, so parse them in parallel across processes
+    with ProcessPoolExecutor() as executor:
+        results = list(executor.map(test_python_file, sorted(python_files), chunksize=16))
+    
+    for file_path, ok, message in results:
+        print(message)
+        if ok:
             passed += 1
         else:
             failed += 1
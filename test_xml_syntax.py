@@ -6,29 +6,29 @@ Test script to validate XML files for the Git Timesheet Mapper addon.
 import sys
 import os
 import xml.etree.ElementTree as ET
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
 
 def test_xml_file(file_path):
-    """Test if an XML file is well-formed."""
+    """Test if an XML file is well-formed.
+
+    Runs in a worker process, so the outcome is returned as
+    ``(file_path, ok, message)`` and printed by the parent in order.
+    """
     try:
         ET.parse(file_path)
-        print(f"✓ {file_path}: XML OK")
-        return True
+        return file_path, True, f"✓ {file_path}: XML OK"
     except ET.ParseError as e:
-        print(f"✗ {file_path}: XML Parse Error - {e}")
-        return False
+        return file_path, False, f"✗ {file_path}: XML Parse Error - {e}"
     except Exception as e:
-        print(f"✗ {file_path}: Error - {e}")
-        return False
+        return file_path, False, f"✗ {file_path}: Error - {e}"
 
 def find_xml_files(directory):
     """Find all XML files in a directory recursively."""
-    xml_files = []
-    for root, dirs, files in os.walk(directory):
-        for file in files:
-            if file.endswith('.xml'):
-                xml_files.append(os.path.join(root, file))
-    
-    return xml_files
+    return [
+        str(path) for path in Path(directory).rglob('*.xml')
+        if '__pycache__' not in path.parts
+    ]
 
 def main():
     """Main test function."""
@@ -46,8 +46,13 @@ def main():
     passed = 0
     failed = 0
     
-    for file_path in sorted(xml_files):
-        if test_xml_file(file_path):
+    # Files are independent, so parse them in parallel across processes
+    with ProcessPoolExecutor() as executor:
+        results = list(executor.map(test_xml_file, sorted(xml_files), chunksize=16))
+    
+    for file_path, ok, message in results:
+        print(message)
+        if ok:
             passed += 1
         else:
             failed += 1
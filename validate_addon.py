@@ -6,69 +6,404 @@ Checks for common issues that could cause Odoo module installation failures.
 
 import sys
 import os
+import argparse
 import ast
-import xml.etree.ElementTree as ET
-import json
-from datetime import datetime
+import hashlib
+import mmap
+import re
+import subprocess
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from importlib.util import find_spec
+from pathlib import Path
 
-def validate_python_syntax(addon_path):
-    """Validate Python syntax in all .py files."""
-    print("🐍 Validating Python syntax...")
-    python_files = []
-    for root, dirs, files in os.walk(addon_path):
-        dirs[:] = [d for d in dirs if d != '__pycache__']
-        for file in files:
-            if file.endswith('.py'):
-                python_files.append(os.path.join(root, file))
+_MODEL_BASES = frozenset({'Model', 'TransientModel', 'AbstractModel'})
+
+# ast node types for exact type() checks; ast classes are never subclassed
+_CD, _FD, _AT, _NA = ast.ClassDef, ast.FunctionDef, ast.Attribute, ast.Name
+
+# Text prefilter for ModelInitChecker: it must be cheap and never miss a
+# model, so any mention of models.<Model base> anywhere sends the file on
+_MODEL_CLASS_RE = re.compile(rb'\bmodels\s*\.\s*(?:Model|TransientModel|AbstractModel)\b')
+
+# Files above this size are skipped rather than read and parsed
+MAX_FILE_SIZE = 2 << 20  # 2 MiB
+
+CACHE_DIR = '.validate_cache'
+CACHE_VERSION = 2
+
+def _cache_key():
+    """Key that invalidates the cache when the tool, Python or XML parser changes."""
+    salt = repr((CACHE_VERSION, tuple(sys.version_info), ast.__doc__ or "", find_spec('lxml') is not None))
+    return hashlib.sha256(salt.encode()).hexdigest()
+
+def _cache_load():
+    """Return the hashes of files that were valid on the last run."""
+    import json
+    try:
+        with open(os.path.join(CACHE_DIR, 'index.json'), 'r', encoding='utf-8') as f:
+            index = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(index, dict) or index.get('key') != _cache_key():
+        return {}
+    return index.get('files', {})
+
+class HashCache:
+    """Skip files whose content passed every check on a previous run.
     
-    errors = []
-    for file_path in python_files:
+    Only hashes seen during this run are written back, so entries for
+    edited or deleted files drop out of the index by themselves.
+    """
+
+    def __init__(self):
+        self.known = _cache_load()
+        self.valid = {}
+
+    # The file kind is hashed in so an empty .py never vouches for an empty
+    # .xml; the seeded states are copied rather than prefixing each file
+    _SEEDS = {kind: hashlib.sha256(kind.encode() + b'\0') for kind in ('py', 'xml')}
+
+    @classmethod
+    def digest(cls, content, kind):
+        state = cls._SEEDS[kind].copy()
+        state.update(content)
+        return state.hexdigest()
+
+    def hit(self, digest):
+        """Return True if the content was valid last time, keeping it."""
+        if self.known.get(digest) == 'ok':
+            self.valid[digest] = 'ok'
+            return True
+        return False
+
+    def add(self, digest):
+        self.valid[digest] = 'ok'
+
+    def save(self, partial=False):
+        """Write the index; a partial run keeps the entries it did not see."""
+        import json
+        files = {**self.known, **self.valid} if partial else self.valid
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            ast.parse(content, filename=file_path)
-        except SyntaxError as e:
-            errors.append(f"Syntax error in {file_path}: {e}")
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            with open(os.path.join(CACHE_DIR, 'index.json'), 'w', encoding='utf-8') as f:
+                json.dump({'key': _cache_key(), 'files': files}, f)
+        except OSError as e:
+            print(f"⚠️  Could not write validation cache: {e}")
+
+@dataclass
+class ParseCache:
+    """Results of the single parse pass over the addon's Python files."""
+    errors: list = field(default_factory=list)
+    issues: list = field(default_factory=list)
+    skipped: list = field(default_factory=list)
+    file_count: int = 0
+
+    @classmethod
+    def build(cls, addon_path, hash_cache, executor, only=None):
+        """Walk the addon once and check each Python file in a worker."""
+        cache = cls()
+        jobs = collect_and_parse(addon_path, cache, hash_cache, only)
+        for digest, error, issues in executor.map(_check_py, jobs, chunksize=16):
+            if error:
+                cache.errors.append(error)
+            elif issues:
+                cache.issues.extend(issues)
+            else:
+                hash_cache.add(digest)
+        return cache
+
+class FileSkipped(Exception):
+    """Raised for a file too large to be worth validating."""
+
+@contextmanager
+def _mapped(file_path):
+    """Map a file read-only so it can be hashed without reading it into memory.
+    
+    mmap rejects empty files, so those yield b'' instead.
+    """
+    with open(file_path, 'rb') as f:
+        if not os.fstat(f.fileno()).st_size:
+            yield b''
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            yield mm
+
+def _read_unless_cached(file_path, kind, hash_cache, staged=None):
+    """Return (digest, content) for a file to check, or (digest, None) on a cache hit.
+    
+    Cached files are only paged in for the hash; the bytes handed to the
+    workers are copied out of the mapping for the files left to check.
+    When staged content is given, it is checked instead of the file.
+    """
+    if staged is not None:
+        return _prefilter(file_path, staged, kind, hash_cache)
+    with _mapped(file_path) as mapped:
+        return _prefilter(file_path, mapped, kind, hash_cache)
+
+def _prefilter(file_path, content, kind, hash_cache):
+    """Reject oversized or binary content, then look it up in the hash cache."""
+    # For a mapped file the size comes from the fstat() _mapped already made
+    if len(content) > MAX_FILE_SIZE:
+        raise FileSkipped(f"{file_path} is larger than {MAX_FILE_SIZE >> 20} MiB")
+    if b'\0' in content[:512]:
+        raise ValueError("file looks binary (NUL byte in its first 512 bytes)")
+    digest = hash_cache.digest(content, kind)
+    if hash_cache.hit(digest):
+        return digest, None
+    return digest, bytes(content)
+
+def iter_files(root, pattern, only=None):
+    """Lazily yield the paths under root matching pattern, outside __pycache__.
+    
+    When only is given, the paths are taken from that mapping of changed
+    files instead of walking the tree. Paths are interned, so the job
+    tuples and every message about a file share one string.
+    """
+    if only is not None:
+        suffix = pattern.lstrip('*')
+        return (sys.intern(path) for path in only if path.endswith(suffix))
+    return (sys.intern(str(p)) for p in Path(root).rglob(pattern) if '__pycache__' not in p.parts)
+
+def changed_files(addon_path, since=None):
+    """Return the addon files added or modified in git, or None if git fails.
+    
+    Without since, the staged changes are listed, as a pre-commit hook
+    sees them; with since, every change from that revision to the
+    working tree.
+    """
+    cmd = ['git', 'diff', '--name-only', '--relative', '--diff-filter=ACMR', '-z']
+    cmd.append(since if since else '--cached')
+    cmd += ['--', addon_path]
+    try:
+        output = subprocess.check_output(cmd, stderr=subprocess.DEVNULL)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return [os.path.normpath(path) for path in output.decode().split('\0') if path]
+
+def staged_blobs(paths):
+    """Return {path: content staged in the git index} for paths, or None if git fails.
+    
+    All blobs are read through a single git cat-file --batch process.
+    """
+    request = ''.join(f":./{path.replace(os.sep, '/')}\n" for path in paths).encode()
+    try:
+        output = subprocess.run(
+            ['git', 'cat-file', '--batch'], input=request,
+            stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, check=True
+        ).stdout
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    blobs = {}
+    pos = 0
+    for path in paths:
+        # Each object is '<sha> <type> <size>\n<content>\n', or '<name> missing\n'
+        end = output.index(b'\n', pos)
+        header = output[pos:end].split()
+        if header[-1] == b'missing':
+            return None
+        start = end + 1
+        size = int(header[2])
+        blobs[path] = output[start:start + size]
+        pos = start + size + 1
+    return blobs
+
+def collect_and_parse(addon_path, cache, hash_cache, only=None):
+    """Yield (path, source, digest) for every Python file left to check.
+    
+    Files whose content passed every check on the last run are skipped;
+    files that cannot be read or look binary are recorded in cache.errors
+    and files over MAX_FILE_SIZE in cache.skipped.
+    """
+    for file_path in iter_files(addon_path, '*.py', only):
+        try:
+            digest, source = _read_unless_cached(
+                file_path, 'py', hash_cache, only and only[file_path]
+            )
+        except FileSkipped as e:
+            cache.skipped.append(str(e))
+            continue
         except Exception as e:
-            errors.append(f"Error parsing {file_path}: {e}")
+            cache.errors.append(f"Error parsing {file_path}: {e}")
+            source = None
+        cache.file_count += 1
+        if source is not None:
+            yield file_path, source, digest
+
+def _check_py(job):
+    """Parse one Python file and run the model checks on it.
+    
+    Runs in a worker process, so only the verdict travels back to the
+    parent, never the tree.
+    """
+    file_path, source, digest = job
+    try:
+        # compile takes bytes and honours the coding cookie itself
+        if _MODEL_CLASS_RE.search(source) is None:
+            # No Odoo model is declared here, so the tree is never lifted to
+            # Python objects: compile for the verdict and drop the code
+            compile(source, file_path, 'exec', dont_inherit=True)
+            return digest, None, None
+        tree = compile(source, file_path, 'exec', flags=ast.PyCF_ONLY_AST, dont_inherit=True)
+    except SyntaxError as e:
+        return digest, f"Syntax error in {file_path}: {e}", None
+    except Exception as e:
+        return digest, f"Error parsing {file_path}: {e}", None
+    checker = ModelInitChecker(file_path)
+    checker.visit(tree)
+    return digest, None, checker.issues
+
+def _is_odoo_model(bases):
+    """Return True if one of the class bases is models.<Model base>."""
+    for base in bases:
+        if (type(base) is _AT and
+                type(base.value) is _NA and
+                base.value.id == 'models' and
+                base.attr in _MODEL_BASES):
+            return True
+    return False
+
+class ModelInitChecker(ast.NodeVisitor):
+    """Find suspicious __init__ methods in the Odoo models of a module.
+    
+    Only the module body and the class bodies are visited; generic_visit
+    is never called, so method bodies and expressions are skipped.
+    """
+
+    def __init__(self, file_path):
+        self.file_path = file_path
+        self.issues = []
+
+    def visit_Module(self, node):
+        for child in node.body:
+            if type(child) is _CD:
+                self.visit_ClassDef(child)
+
+    def visit_ClassDef(self, node):
+        # Check if it's likely an Odoo model
+        if not _is_odoo_model(node.bases):
+            return
+        
+        # Check for __init__ method, stopping at the first one
+        method = next((m for m in node.body if type(m) is _FD and m.name == '__init__'), None)
+        if method is None:
+            return
+        
+        # Check parameter count (should be self, env, ids, prefetch_ids)
+        params = method.args.args
+        if len(params) != 4:  # self + 3 Odoo parameters
+            self.issues.append(f"Suspicious __init__ method in {self.file_path}, class {node.name}: expected 4 parameters, got {len(params)}")
+
+_xml_backend = None
+
+def _get_xml_backend():
+    """Return (parse, errors) for this process, importing the parser on first use.
+    
+    lxml comes with Odoo; fall back to ElementTree when run without it.
+    """
+    global _xml_backend
+    if _xml_backend is None:
+        import xml.etree.ElementTree as ET
+        try:
+            from lxml import etree
+        except ImportError:
+            _xml_backend = ET.fromstring, (ET.ParseError,)
+        else:
+            # One parser per process; well-formedness needs neither ids nor entities
+            parser = etree.XMLParser(collect_ids=False, huge_tree=False, resolve_entities=False)
+            _xml_backend = (
+                lambda content: etree.fromstring(content, parser),
+                (etree.XMLSyntaxError, ET.ParseError),
+            )
+    return _xml_backend
+
+def _check_xml(job):
+    """Check that one XML file is well-formed (worker process)."""
+    file_path, content, digest = job
+    parse, parse_errors = _get_xml_backend()
+    try:
+        parse(content)
+    except parse_errors as e:
+        return digest, f"XML parse error in {file_path}: {e}"
+    except Exception as e:
+        return digest, f"Error parsing {file_path}: {e}"
+    return digest, None
+
+def _print_items(items):
+    """Print items as a bulleted list with a single write."""
+    sys.stdout.write('  - ' + '\n  - '.join(items) + '\n')
+
+def validate_python_syntax(parse_cache):
+    """Validate Python syntax in all .py files."""
+    print("🐍 Validating Python syntax...")
+    errors = parse_cache.errors
+    if parse_cache.skipped:
+        print("⚠️  Skipped Python files:")
+        _print_items(parse_cache.skipped)
     
     if errors:
         print("❌ Python syntax errors found:")
-        for error in errors:
-            print(f"  - {error}")
+        _print_items(errors)
         return False
     else:
-        print(f"✅ All {len(python_files)} Python files have valid syntax")
+        print(f"✅ All {parse_cache.file_count} Python files have valid syntax")
         return True
 
-def validate_xml_syntax(addon_path):
+def validate_xml_syntax(addon_path, hash_cache, executor, only=None):
     """Validate XML syntax in all .xml files."""
     print("\n📄 Validating XML syntax...")
-    xml_files = []
-    for root, dirs, files in os.walk(addon_path):
-        for file in files:
-            if file.endswith('.xml'):
-                xml_files.append(os.path.join(root, file))
-    
     errors = []
-    for file_path in xml_files:
+    jobs = []
+    skipped = []
+    xml_count = 0
+    for file_path in iter_files(addon_path, '*.xml', only):
         try:
-            ET.parse(file_path)
-        except ET.ParseError as e:
-            errors.append(f"XML parse error in {file_path}: {e}")
+            digest, content = _read_unless_cached(
+                file_path, 'xml', hash_cache, only and only[file_path]
+            )
+        except FileSkipped as e:
+            skipped.append(str(e))
+            continue
         except Exception as e:
             errors.append(f"Error parsing {file_path}: {e}")
+            content = None
+        xml_count += 1
+        if content is not None:
+            jobs.append((file_path, content, digest))
+    
+    for digest, error in executor.map(_check_xml, jobs, chunksize=16):
+        if error:
+            errors.append(error)
+        else:
+            hash_cache.add(digest)
+    
+    if skipped:
+        print("⚠️  Skipped XML files:")
+        _print_items(skipped)
     
     if errors:
         print("❌ XML syntax errors found:")
-        for error in errors:
-            print(f"  - {error}")
+        _print_items(errors)
         return False
     else:
-        print(f"✅ All {len(xml_files)} XML files are well-formed")
+        print(f"✅ All {xml_count} XML files are well-formed")
         return True
 
-def validate_manifest(addon_path):
+def _index_tree(root):
+    """Return the relative paths, with '/' separators, of every file under root."""
+    out = set()
+    for dirpath, dirs, files in os.walk(root):
+        dirs[:] = [d for d in dirs if d != '__pycache__']
+        rel = os.path.relpath(dirpath, root).replace(os.sep, '/')
+        out.update(sys.intern(rel + '/' + f if rel != '.' else f) for f in files)
+    return out
+
+def _index_key(path):
+    """Normalize a manifest path ('./views//x.xml', 'a\\b') to an _index_tree key."""
+    return os.path.normpath(path).replace(os.sep, '/')
+
+def validate_manifest(addon_path, existing):
     """Validate the addon manifest file."""
     print("\n📋 Validating manifest file...")
     manifest_path = os.path.join(addon_path, '__manifest__.py')
@@ -81,20 +416,15 @@ def validate_manifest(addon_path):
         with open(manifest_path, 'r', encoding='utf-8') as f:
             content = f.read()
         
-        # Parse the manifest - it should be a Python dictionary
-        import ast
-        tree = ast.parse(content)
-        
-        # Find the dictionary definition
-        manifest = None
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Dict):
-                # Execute the dictionary to get its value
-                manifest = eval(compile(ast.Expression(node), '<string>', 'eval'))
-                break
+        # Parse the manifest - it should be a Python dictionary literal,
+        # read the same way Odoo reads it, without evaluating any code
+        try:
+            manifest = ast.literal_eval(content)
+        except (ValueError, SyntaxError):
+            manifest = None
         
-        if manifest is None:
-            print("❌ No dictionary found in __manifest__.py")
+        if not isinstance(manifest, dict):
+            print("❌ __manifest__.py is not a literal dict")
             return False
         
         # Check required fields
@@ -108,23 +438,21 @@ def validate_manifest(addon_path):
         # Check if data files exist
         errors = []
         for data_file in manifest.get('data', []):
-            file_path = os.path.join(addon_path, data_file)
-            if not os.path.exists(file_path):
+            if _index_key(data_file) not in existing:
                 errors.append(f"Data file not found: {data_file}")
         
         # Check if asset files exist
+        addon_prefix = f"{os.path.basename(addon_path)}/"
         for asset_bundle, asset_files in manifest.get('assets', {}).items():
             for asset_file in asset_files:
-                if asset_file.startswith(f"{os.path.basename(addon_path)}/"):
-                    relative_path = asset_file[len(os.path.basename(addon_path))+1:]
-                    file_path = os.path.join(addon_path, relative_path)
-                    if not os.path.exists(file_path):
+                if asset_file.startswith(addon_prefix):
+                    relative_path = asset_file[len(addon_prefix):]
+                    if _index_key(relative_path) not in existing:
                         errors.append(f"Asset file not found: {asset_file}")
         
         if errors:
             print("❌ Manifest validation errors:")
-            for error in errors:
-                print(f"  - {error}")
+            _print_items(errors)
             return False
         else:
             print("✅ Manifest file is valid")
@@ -134,76 +462,34 @@ def validate_manifest(addon_path):
         print(f"❌ Error validating manifest: {e}")
         return False
 
-def check_model_init_methods(addon_path):
+def check_model_init_methods(parse_cache):
     """Check for problematic __init__ methods in Odoo models."""
     print("\n🔧 Checking model __init__ methods...")
     
-    python_files = []
-    for root, dirs, files in os.walk(addon_path):
-        dirs[:] = [d for d in dirs if d != '__pycache__']
-        for file in files:
-            if file.endswith('.py'):
-                python_files.append(os.path.join(root, file))
-    
-    issues = []
-    for file_path in python_files:
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            # Parse the AST
-            tree = ast.parse(content, filename=file_path)
-            
-            for node in ast.walk(tree):
-                if isinstance(node, ast.ClassDef):
-                    # Check if it's likely an Odoo model
-                    is_odoo_model = False
-                    for base in node.bases:
-                        if isinstance(base, ast.Attribute):
-                            if (isinstance(base.value, ast.Name) and 
-                                base.value.id == 'models' and 
-                                base.attr in ['Model', 'TransientModel', 'AbstractModel']):
-                                is_odoo_model = True
-                                break
-                    
-                    if is_odoo_model:
-                        # Check for __init__ method
-                        for method in node.body:
-                            if (isinstance(method, ast.FunctionDef) and 
-                                method.name == '__init__'):
-                                
-                                # Check parameter count (should be self, env, ids, prefetch_ids)
-                                params = method.args.args
-                                if len(params) != 4:  # self + 3 Odoo parameters
-                                    issues.append(f"Suspicious __init__ method in {file_path}, class {node.name}: expected 4 parameters, got {len(params)}")
-        
-        except Exception as e:
-            # Skip files that can't be parsed
-            continue
+    # Found by the workers of the parse pass; files that failed to parse
+    # are already reported by the syntax check
+    issues = parse_cache.issues
     
     if issues:
         print("⚠️  Potential __init__ method issues found:")
-        for issue in issues:
-            print(f"  - {issue}")
+        _print_items(issues)
         return False
     else:
         print("✅ No problematic __init__ methods detected")
         return True
 
-def validate_directory_structure(addon_path):
+def validate_directory_structure(addon_path, existing):
     """Validate the addon directory structure."""
     print("\n📁 Validating directory structure...")
     
-    # Expected directories
+    # Expected directories; DirEntry.is_dir needs no extra stat() call
     expected_dirs = ['models', 'views', 'security', 'data']
-    existing_dirs = [d for d in os.listdir(addon_path) if os.path.isdir(os.path.join(addon_path, d))]
+    with os.scandir(addon_path) as entries:
+        existing_dirs = [entry.name for entry in entries if entry.is_dir()]
     
     # Check for important files
     important_files = ['__manifest__.py', '__init__.py']
-    missing_files = []
-    for file in important_files:
-        if not os.path.exists(os.path.join(addon_path, file)):
-            missing_files.append(file)
+    missing_files = [file for file in important_files if file not in existing]
     
     issues = []
     
@@ -211,23 +497,40 @@ def validate_directory_structure(addon_path):
         issues.append(f"Missing important files: {missing_files}")
     
     # Check if models/__init__.py exists
-    models_init = os.path.join(addon_path, 'models', '__init__.py')
-    if os.path.exists(os.path.join(addon_path, 'models')) and not os.path.exists(models_init):
+    if 'models' in existing_dirs and 'models/__init__.py' not in existing:
         issues.append("models/__init__.py file is missing")
     
     if issues:
         print("❌ Directory structure issues:")
-        for issue in issues:
-            print(f"  - {issue}")
+        _print_items(issues)
         return False
     else:
         print("✅ Directory structure looks good")
         return True
 
+def parse_args():
+    """Parse the command line options selecting which files to check."""
+    parser = argparse.ArgumentParser(description="Validate the Git Timesheet Mapper addon.")
+    scope = parser.add_mutually_exclusive_group()
+    scope.add_argument('--changed', action='store_true',
+                       help="only check the staged content of the staged .py/.xml files")
+    scope.add_argument('--since', metavar='REV',
+                       help="only check the .py/.xml files changed since REV")
+    scope.add_argument('--all', action='store_true',
+                       help="check every file (the default)")
+    parser.add_argument('--write-pyc', action='store_true',
+                        help="byte-compile the addon with compileall once every check passes")
+    return parser.parse_args()
+
 def main():
     """Main validation function."""
+    args = parse_args()
     addon_path = "git_timesheet_mapper"
     
+    # Buffer the whole report instead of flushing it line by line on a tty
+    if hasattr(sys.stdout, 'reconfigure'):
+        sys.stdout.reconfigure(line_buffering=False)
+    
     if not os.path.exists(addon_path):
         print(f"❌ Addon directory '{addon_path}' not found")
         sys.exit(1)
@@ -235,13 +538,39 @@ def main():
     print("🚀 Git Timesheet Mapper - Comprehensive Validation")
     print("=" * 60)
     
-    all_checks = [
-        validate_directory_structure(addon_path),
-        validate_python_syntax(addon_path),
-        validate_xml_syntax(addon_path),
-        validate_manifest(addon_path),
-        check_model_init_methods(addon_path)
-    ]
+    # The scope is only narrowed on request. --changed checks the staged
+    # blobs, which is what is about to be committed, while --since reads the
+    # working tree. The manifest and structure checks are cheap and always
+    # cover the whole addon.
+    only = None
+    if args.since or args.changed:
+        paths = changed_files(addon_path, args.since)
+        if paths is not None:
+            only = staged_blobs(paths) if args.changed else dict.fromkeys(paths)
+        if only is None:
+            print("⚠️  Could not read changed files from git, checking every file")
+        elif args.changed:
+            print(f"🔍 Checking the staged content of {len(only)} changed file(s)")
+        else:
+            print(f"🔍 Checking {len(only)} changed file(s) since {args.since}")
+    
+    # Read and parse the Python files once for both Python checks, skipping
+    # files whose content was already valid on the last run. Parsing runs
+    # in worker processes, which only start if some file needs checking.
+    hash_cache = HashCache()
+    # Every file path in the addon, for the existence checks
+    existing = _index_tree(addon_path)
+    with ProcessPoolExecutor() as executor:
+        parse_cache = ParseCache.build(addon_path, hash_cache, executor, only)
+        
+        all_checks = [
+            validate_directory_structure(addon_path, existing),
+            validate_python_syntax(parse_cache),
+            validate_xml_syntax(addon_path, hash_cache, executor, only),
+            validate_manifest(addon_path, existing),
+            check_model_init_methods(parse_cache)
+        ]
+    hash_cache.save(partial=only is not None)
     
     print("\n" + "=" * 60)
     print("📊 VALIDATION SUMMARY")
@@ -254,7 +583,18 @@ def main():
         print(f"🎉 All {total_checks} validation checks PASSED!")
         print("✅ The addon should be ready for Odoo installation")
         
+        if args.write_pyc:
+            # compileall skips up-to-date .pyc files and compiles the rest in
+            # parallel, so Odoo starts from warm bytecode
+            import compileall
+            if compileall.compile_dir(addon_path, quiet=2, workers=0):
+                print("📦 Bytecode written to __pycache__")
+            else:
+                print("⚠️  Could not write bytecode for every file")
+        
         # Save validation report
+        import json
+        from datetime import datetime
         report = {
             'timestamp': datetime.now().isoformat(),
             'addon_name': 'git_timesheet_mapper',
@@ -264,8 +604,10 @@ def main():
             'issues': []
         }
         
-        with open('validation_report.json', 'w') as f:
-            json.dump(report, f, indent=2)
+        # Read by tooling, so encode compactly on the C fast path in one write
+        Path('validation_report.json').write_text(
+            json.dumps(report, separators=(',', ':')), encoding='utf-8'
+        )
         
         print(f"📄 Validation report saved to: validation_report.json")
         sys.exit(0)